@@ -1,7 +1,13 @@
 from datetime import datetime as _dt
 from logging import getLogger as _getLogger
-from re import NOFLAG as _NOFLAG, compile as _re_comp
-from typing import Literal as _Lit, TypedDict as _TDict, final as _fin
+from re import NOFLAG as _NOFLAG, Pattern as _Pattern, compile as _re_comp
+from typing import (
+    Callable as _Call,
+    Literal as _Lit,
+    Mapping as _Map,
+    TypedDict as _TDict,
+    final as _fin,
+)
 
 
 @_fin
@@ -25,15 +31,7 @@ VERSION = "6.9.0"
 
 FLASHCARD_EASE_DEFAULT = 250
 FLASHCARD_STATES_FORMAT = "<!--SR:{states}-->"
-FLASHCARD_STATES_REGEX = _re_comp(r"<!--SR:(.*?)-->", _NOFLAG)
 GENERATE_COMMENT_FORMAT = "<!-- The following content is generated at {now}. Any edits will be overridden! -->"
-GENERATE_COMMENT_REGEX = _re_comp(
-    r"^<!-- The following content is generated at (\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}\+\d{2}:\d{2}). Any edits will be overridden! -->",
-    _NOFLAG,
-)
-assert GENERATE_COMMENT_REGEX.search(
-    GENERATE_COMMENT_FORMAT.format(now=_dt.now().astimezone().isoformat())
-)
 
 LOGGER = _getLogger(NAME)
 OPEN_TEXT_OPTIONS = _OpenOptions(
@@ -42,3 +40,29 @@ OPEN_TEXT_OPTIONS = _OpenOptions(
     newline=None,
 )
 UUID = "08e5b0a3-f78a-46af-bf50-eb9b12f7fa1e"
+
+
+def _generate_comment_regex():
+    ret = _re_comp(
+        r"^<!-- The following content is generated at (\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}\+\d{2}:\d{2}). Any edits will be overridden! -->",
+        _NOFLAG,
+    )
+    assert ret.search(
+        GENERATE_COMMENT_FORMAT.format(now=_dt.now().astimezone().isoformat())
+    )
+    return ret
+
+
+_LAZY_ATTRIBUTES: _Map[str, _Call[[], _Pattern[str]]] = {
+    "FLASHCARD_STATES_REGEX": lambda: _re_comp(r"<!--SR:(.*?)-->", _NOFLAG),
+    "GENERATE_COMMENT_REGEX": _generate_comment_regex,
+}
+
+
+def __getattr__(name: str):
+    try:
+        factory = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    ret = globals()[name] = factory()
+    return ret
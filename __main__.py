@@ -1,9 +1,13 @@
 from logging import INFO, basicConfig
-from .main import parser as _parser
+from .main import parser as _parser, sniff_subcommand as _sniff_subcmd
 from asyncio import run as _run
 from sys import argv as _argv
 
 if __name__ == "__main__":
+    args = _argv[1:]
+    subcommand = _sniff_subcmd(args)
+    entry = _parser(subcommands=() if subcommand is None else (subcommand,)).parse_args(
+        args
+    )
     basicConfig(level=INFO)
-    entry = _parser().parse_args(_argv[1:])
     _run(entry.invoke(entry))
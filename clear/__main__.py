@@ -4,6 +4,6 @@ from asyncio import run as _run
 from sys import argv as _argv
 
 if __name__ == "__main__":
-    basicConfig(level=INFO)
     entry = _parser().parse_args(_argv[1:])
+    basicConfig(level=INFO)
     _run(entry.invoke(entry))
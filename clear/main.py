@@ -1,15 +1,17 @@
 from .. import LOGGER as _LOGGER, VERSION as _VER
 from ..io import ClearOpts as _ClrOpts, ClearType as _ClrT, ClearWriter as _ClrWriter
+from ..util import resolve_paths as _resolve_paths
 from anyio import Path as _Path
 from argparse import (
     ArgumentParser as _ArgParser,
     Namespace as _NS,
     ONE_OR_MORE as _ONE_OR_MORE,
 )
-from asyncio import gather as _gather
+from asyncio import TaskGroup as _TaskGrp
 from dataclasses import dataclass as _dc
 from enum import IntFlag as _IntFlg, auto as _auto, unique as _unq
-from functools import partial as _partial, reduce as _reduce, wraps as _wraps
+from functools import reduce as _reduce, wraps as _wraps
+from operator import or_ as _or
 from sys import exit as _exit
 from typing import (
     AbstractSet as _ASet,
@@ -19,6 +21,9 @@ from typing import (
     final as _fin,
 )
 
+_CLEAR_TYPE_CHOICES = tuple(_ClrT.__members__.values())
+_CLEAR_TYPE_DEFAULTS = frozenset({_ClrT.CONTENT})
+
 
 @_fin
 @_unq
@@ -60,11 +65,9 @@ async def main(args: Arguments):
             return ExitCode.ERROR
         return ExitCode(0)
 
-    exit_code = _reduce(
-        lambda left, right: left | right,
-        await _gather(*map(write, args.inputs)),
-        exit_code,
-    )
+    async with _TaskGrp() as group:
+        writes = tuple(map(group.create_task, map(write, args.inputs)))
+    exit_code = _reduce(_or, (task.result() for task in writes), exit_code)
     _exit(exit_code)
 
 
@@ -90,9 +93,9 @@ def parser(parent: _Call[..., _ArgParser] | None = None):
         "--type",
         action="store",
         nargs=_ONE_OR_MORE,
-        choices=_ClrT.__members__.values(),
+        choices=_CLEAR_TYPE_CHOICES,
         type=_ClrT,
-        default=frozenset({_ClrT.CONTENT}),
+        default=_CLEAR_TYPE_DEFAULTS,
         dest="types",
         help="list of type(s) of data to clear",
     )
@@ -108,12 +111,7 @@ def parser(parent: _Call[..., _ArgParser] | None = None):
     async def invoke(args: _NS):
         await main(
             Arguments(
-                inputs=await _gather(
-                    *map(
-                        _partial(_Path.resolve, strict=True),
-                        args.inputs,
-                    )
-                ),
+                inputs=await _resolve_paths(args.inputs, strict=True),
                 types=args.types,
             )
         )
@@ -1,27 +1,29 @@
 from .. import LOGGER as _LOGGER, VERSION as _VER
 from ..io import GenOpts as _GenOpts, Reader as _Reader, Writer as _Writer
-from ..util import CompileCache as _CompCache
+from ..util import CompileCache as _CompCache, resolve_paths as _resolve_paths
 from anyio import Path as _Path
 from argparse import (
     ArgumentParser as _ArgParser,
     Namespace as _NS,
     ONE_OR_MORE as _ONE_OR_MORE,
 )
-from asyncio import gather as _gather
+from asyncio import Semaphore as _Semaphore, TaskGroup as _TaskGrp
 from dataclasses import dataclass as _dc
 from enum import IntFlag as _IntFlg, auto as _auto, unique as _unq
-from functools import partial as _partial, reduce as _reduce, wraps as _wraps
-from itertools import chain as _chain
+from functools import reduce as _reduce, wraps as _wraps
+from operator import or_ as _or
+from os import cpu_count as _cpu_count
 from sys import exit as _exit
 from typing import (
     Callable as _Call,
     ClassVar as _ClsVar,
-    Iterable as _Iter,
-    MutableSequence as _MSeq,
     Sequence as _Seq,
     final as _fin,
 )
 
+_CODE_CACHE_DEFAULT = _Path("./__pycache__/")
+_CONCURRENCY = min(64, (_cpu_count() or 1) * 8)
+
 
 @_fin
 @_unq
@@ -53,51 +55,44 @@ class Arguments:
 
 async def main(args: Arguments):
     exit_code = ExitCode(0)
+    semaphore = _Semaphore(_CONCURRENCY)
 
     async def read(input: _Path):
-        try:
-            return (await _Reader.cached(path=input, options=args.options)).pipe()
-        except Exception:
-            _LOGGER.exception(f"Exception reading file: {input}")
-            return ExitCode.READ_ERROR
-
-    def reduce_read_result(
-        left: tuple[_MSeq[_Iter[_Writer]], ExitCode],
-        right: _Iter[_Writer] | ExitCode,
-    ):
-        seq, code = left
-        if isinstance(right, ExitCode):
-            code |= right
+        async with semaphore:
+            try:
+                return (await _Reader.cached(path=input, options=args.options)).pipe()
+            except Exception:
+                _LOGGER.exception(f"Exception reading file: {input}")
+                return ExitCode.READ_ERROR
+
+    async with _TaskGrp() as group:
+        reads = tuple(map(group.create_task, map(read, args.inputs)))
+    writers = list[_Writer]()
+    for task in reads:
+        result = task.result()
+        if isinstance(result, ExitCode):
+            exit_code |= result
         else:
-            seq.append(right)
-        return (seq, code)
-
-    writers0, exit_code = _reduce(
-        reduce_read_result,
-        await _gather(*map(read, args.inputs)),
-        (list[_Iter[_Writer]](), exit_code),
-    )
-    writers = _chain.from_iterable(writers0)
+            writers.extend(result)
 
     async def write(writer: _Writer):
-        write = writer.write()
-        try:
-            await write.__aenter__()
-        except Exception:
-            _LOGGER.exception(f"Error while validation: {writer}")
-            return ExitCode.VALIDATE_ERROR
-        try:
-            await write.__aexit__(None, None, None)
-        except Exception:
-            _LOGGER.exception(f"Error while writing: {writer}")
-            return ExitCode.WRITE_ERROR
-        return ExitCode(0)
-
-    exit_code = _reduce(
-        lambda left, right: left | right,
-        await _gather(*map(write, writers)),
-        exit_code,
-    )
+        async with semaphore:
+            write = writer.write()
+            try:
+                await write.__aenter__()
+            except Exception:
+                _LOGGER.exception(f"Error while validation: {writer}")
+                return ExitCode.VALIDATE_ERROR
+            try:
+                await write.__aexit__(None, None, None)
+            except Exception:
+                _LOGGER.exception(f"Error while writing: {writer}")
+                return ExitCode.WRITE_ERROR
+            return ExitCode(0)
+
+    async with _TaskGrp() as group:
+        writes = tuple(map(group.create_task, map(write, writers)))
+    exit_code = _reduce(_or, (task.result() for task in writes), exit_code)
     _exit(exit_code)
 
 
@@ -154,7 +149,7 @@ def parser(parent: _Call[..., _ArgParser] | None = None):
     code_cache_group.add_argument(
         "--code-cache",
         action="store",
-        default=_Path("./__pycache__/"),
+        default=_CODE_CACHE_DEFAULT,
         type=_Path,
         help="specify code cache (default: ./__pycache__/)",
         dest="code_cache",
@@ -186,9 +181,7 @@ def parser(parent: _Call[..., _ArgParser] | None = None):
         ) as cache:
             await main(
                 Arguments(
-                    inputs=await _gather(
-                        *map(_partial(_Path.resolve, strict=True), args.inputs)
-                    ),
+                    inputs=await _resolve_paths(args.inputs, strict=True),
                     options=_GenOpts(
                         timestamp=args.timestamp,
                         init_flashcards=args.init_flashcards,
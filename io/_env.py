@@ -1,6 +1,8 @@
 from .. import UUID as _UUID
 from ast import AsyncFunctionDef as _ASTAFunDef, Module as _ASTMod, parse as _parse
 from contextlib import AbstractAsyncContextManager as _AACtxMgr, nullcontext as _nullctx
+from copy import copy as _copy
+from operator import attrgetter as _attrgetter
 from types import (
     CellType as _Cell,
     CodeType as _Code,
@@ -23,19 +25,27 @@ class Environment:
     ENTRY: _ClsVar = f"_{_UUID.replace('-', '_')}"
     ENTRY_TEMPLATE: _ClsVar = f"""async def {ENTRY}(): pass
 {ENV_NAME}.{ENTRY} = {ENTRY}"""
+    __ENTRY_GETTER: _ClsVar = _attrgetter(ENTRY)
+    __ENTRY_TEMPLATE_AST: _ClsVar = _parse(
+        ENTRY_TEMPLATE, "<string>", "exec", type_comments=True
+    )
     __slots__: _ClsVar = (
         "__closure",
         "__context",
         "__env",
         "__globals",
         "__locals",
+        "__namespace",
     )
 
     @classmethod
     def transform_code(cls, ast: _ASTMod):
-        template = _parse(cls.ENTRY_TEMPLATE, "<string>", "exec", type_comments=True)
+        template = _copy(cls.__ENTRY_TEMPLATE_AST)
+        entry, *rest = template.body
         if ast.body:
-            _cast(_ASTAFunDef, template.body[0]).body = ast.body
+            entry = _copy(_cast(_ASTAFunDef, entry))
+            entry.body = ast.body
+        template.body = [entry, *rest]
         return template
 
     def __init__(
@@ -48,8 +58,11 @@ class Environment:
         context: _Call[[], _AACtxMgr[_Any]] | None = None,
     ):
         self.__env = _FrozenMap(dict(env))
+        self.__namespace = dict(result=None, **self.__env)
         self.__globals = _FrozenMap(dict(globals))
-        self.__locals = _FrozenMap(dict(locals))
+        self.__locals = (
+            self.__globals if locals == globals else _FrozenMap(dict(locals))
+        )
         self.__closure = closure
         self.__context = context if context else lambda: _nullctx()
         assert self.ENV_NAME not in self.globals
@@ -91,18 +104,19 @@ class Environment:
         return self.__closure
 
     async def exec(self, code: _Code, *init_codes: _Code):
-        env = _SimpNS(result=None, **self.env)
-        globals = {**self.globals, self.ENV_NAME: env}
-        locals = (
-            globals
-            if self.locals == self.globals
-            else {**self.locals, self.ENV_NAME: env}
-        )
+        env = _SimpNS(**self.__namespace)
+        globals = self.__globals.copy()
+        globals[self.ENV_NAME] = env
+        if self.__locals is self.__globals:
+            locals = globals
+        else:
+            locals = self.__locals.copy()
+            locals[self.ENV_NAME] = env
         async with self.__context():
             for init_code in init_codes:
                 exec(init_code, globals, locals)
-                export = await getattr(env, self.ENTRY)()
+                export = await self.__ENTRY_GETTER(env)()
                 if export is not None:
                     globals.update(export)
             exec(code, globals, locals, closure=self.closure)
-            return await getattr(env, self.ENTRY)()
+            return await self.__ENTRY_GETTER(env)()
@@ -5,6 +5,7 @@ from ..util import (
     copy_module as _cpy_mod,
     deep_foreach_module as _deep_foreach_mod,
     ignore_args as _i_args,
+    keyed_lock as _keyed_lock,
 )
 from .util import FileSection as _FSect, NULL_LOCATION as _NULL_LOC
 from .virenv.util import StatefulFlashcardGroup as _StFcGrp
@@ -13,34 +14,32 @@ from ._options import GenOpts as _GenOpts
 from ._write import PythonWriter as _PyWriter, Writer as _Writer
 from abc import ABCMeta as _ABCM, abstractmethod as _amethod
 from anyio import Path as _Path
-from ast import parse as _parse
+from ast import increment_lineno as _incr_lineno, parse as _parse
 from asyncio import (
     AbstractEventLoop as _AEvtLoop,
     Lock as _ALock,
+    gather as _gather,
     get_running_loop as _run_loop,
 )
-from asyncstdlib import tuple as _atuple, chain as _achain
 from builtins import __dict__ as _builtins_dict
-from collections import defaultdict as _defdict
 from contextlib import (
     AbstractContextManager as _ACtxMgr,
     asynccontextmanager as _actxmgr,
     contextmanager as _ctxmgr,
     nullcontext as _nullctx,
 )
+from contextvars import ContextVar as _CtxVar
 from dataclasses import replace as _dc_repl
 from functools import cache as _cache, partial as _partial, wraps as _wraps
 from importlib import import_module as _import
 from itertools import chain as _chain, repeat as _repeat
 from more_itertools import unique_everseen as _unq_eseen
-from os.path import splitext as _splitext
 from re import MULTILINE as _MULTILINE, NOFLAG as _NOFLAG, compile as _re_comp
 from sys import modules as _mods
 from threading import Lock as _TLock
 from types import CodeType as _Code, MappingProxyType as _FrozenMap, ModuleType as _Mod
 from typing import (
     Any as _Any,
-    AsyncIterator as _AItor,
     Callable as _Call,
     Collection as _Collect,
     ClassVar as _ClsVar,
@@ -57,7 +56,10 @@ _PYTHON_ENV_BUILTINS_EXCLUDE = frozenset[str](
     # constants: https://docs.python.org/library/constants.html
     # functions: https://docs.python.org/library/functions.html
 )
-_PYTHON_ENV_MODULE_LOCKS = _WkKDict[_AEvtLoop, _Call[[], _ALock]]()
+_PYTHON_ENV_BUILTINS = {
+    k: v for k, v in _builtins_dict.items() if k not in _PYTHON_ENV_BUILTINS_EXCLUDE
+}
+_PYTHON_ENV_MODULE_LOCKS = _WkKDict[_AEvtLoop, _ALock]()
 _PYTHON_ENV_MODULE_CACHE = _WkKDict[
     _AEvtLoop,
     tuple[_Mod, _Map[str, _Mod]],
@@ -67,8 +69,11 @@ _PYTHON_ENV_MODULE_CACHE = _WkKDict[
 class Reader(metaclass=_ABCM):
     __slots__: _ClsVar = ()
     REGISTRY: _ClsVar = dict[str, type[_Self]]()
-    __CACHE: _ClsVar = dict[_Path, _Self]()
-    __CACHE_LOCKS: _ClsVar = _defdict[_Path, _TLock](_TLock)
+    __CACHE: _ClsVar = dict[_Path, tuple[int, "Reader", tuple["Reader", ...]]]()
+    __CACHE_LOCKS: _ClsVar = dict[_Path, _TLock]()
+    __DEPENDENCIES: _ClsVar = _CtxVar[list["Reader"] | None](
+        f"{__qualname__}.__DEPENDENCIES", default=None
+    )
 
     @classmethod
     def register2(cls, *extensions: str):
@@ -76,27 +81,47 @@ class Reader(metaclass=_ABCM):
         def register(subclass: type):
             ret = cls.register(subclass)
             for ext in extensions:
-                cls.REGISTRY[ext] = subclass
+                cls.REGISTRY[ext.lower()] = subclass
             return ret
 
         return register
 
     @classmethod
     async def new(cls, *, path: _Path, options: _GenOpts):
-        _, ext = _splitext(path)
-        ret = cls.REGISTRY[ext](path=path, options=options)
+        ret = cls.REGISTRY[path.suffix.lower()](path=path, options=options)
         async with await path.open(mode="rt", **_OPEN_TXT_OPTS) as io:
             await ret.read(await io.read())
         return ret
 
+    @classmethod
+    async def __lookup(cls, path: _Path) -> "Reader | None":
+        try:
+            mod_time, ret, dependencies = cls.__CACHE[path]
+            if (await path.stat()).st_mtime_ns != mod_time:
+                return None
+        except (KeyError, OSError):
+            return None
+        for dependency in dependencies:
+            if await cls.__lookup(dependency.path) is not dependency:
+                return None
+        return ret
+
     @classmethod
     async def cached(cls, *, path: _Path, options: _GenOpts):
         path = await path.resolve(strict=True)
-        async with _a_lock(cls.__CACHE_LOCKS[path]):
-            try:
-                return cls.__CACHE[path]
-            except KeyError:
-                ret = cls.__CACHE[path] = await cls.new(path=path, options=options)
+        if (ret := await cls.__lookup(path)) is None:
+            async with _a_lock(_keyed_lock(cls.__CACHE_LOCKS, path)):
+                if (ret := await cls.__lookup(path)) is None:
+                    mod_time = (await path.stat()).st_mtime_ns
+                    dependencies = list[Reader]()
+                    token = cls.__DEPENDENCIES.set(dependencies)
+                    try:
+                        ret = await cls.new(path=path, options=options)
+                    finally:
+                        cls.__DEPENDENCIES.reset(token)
+                    cls.__CACHE[path] = (mod_time, ret, tuple(dependencies))
+        if (dependents := cls.__DEPENDENCIES.get()) is not None:
+            dependents.append(ret)
         return ret
 
     @_amethod
@@ -161,6 +186,7 @@ def _Python_env(
     if modifier is None:
         modifier = _i_args(_nullctx)
 
+    @_cache
     def cwf_sect(section: str | None):
         return (
             _NULL_LOC if section is None else _FSect(path=reader.path, section=section)
@@ -172,18 +198,16 @@ def _Python_env(
     def cwf_sects(*sections: str | None):
         return tuple(cwf_sects0(sections))
 
-    vars = {
-        "__builtins__": {
-            k: v
-            for k, v in _builtins_dict.items()
-            if k not in _PYTHON_ENV_BUILTINS_EXCLUDE
-        }
-    }
+    vars = {"__builtins__": _PYTHON_ENV_BUILTINS.copy()}
 
     @_actxmgr
     async def context():
         loop = _run_loop()
-        async with _PYTHON_ENV_MODULE_LOCKS.setdefault(loop, _cache(_ALock))():
+        try:
+            lock = _PYTHON_ENV_MODULE_LOCKS[loop]
+        except KeyError:
+            lock = _PYTHON_ENV_MODULE_LOCKS.setdefault(loop, _ALock())
+        async with lock:
             try:
                 module, modules = _PYTHON_ENV_MODULE_CACHE[loop]
             except KeyError:
@@ -246,7 +270,7 @@ class MarkdownReader:
         self.__path = path
         self.__options = options
         self.__library_codes = list[_Seq[_Code]]()
-        self.__codes = dict[_Code, _Seq[_Code]]()
+        self.__codes = list[tuple[_Code, _Seq[_Code]]]()
 
     async def read(self, text: str, /):
         compiler = _partial(
@@ -257,41 +281,48 @@ class MarkdownReader:
             dont_inherit=True,
             optimize=0,
         )
-        start = self.START.search(text)
-        while start is not None:
+
+        def imports0(readers: _Iter[Reader]) -> _Itor[_Code]:
+            for reader in readers:
+                if not isinstance(reader, CodeLibrary):
+                    raise TypeError(reader)
+                yield from _chain.from_iterable(reader.codes)
+
+        line, line_pos, pos = 0, 0, 0
+        for start in self.START.finditer(text):
+            if start.start() < pos:
+                continue
             stop = self.STOP.search(text, start.end())
             if stop is None:
                 raise ValueError(f"Unenclosure at char {start.start()}")
-            code = text[start.end() : stop.start()]
-            ast = _Env.transform_code(
-                _parse(
-                    ("\n" * text.count("\n", 0, start.end())) + code,
-                    self.path,
-                    "exec",
-                    type_comments=True,
+            line += text.count("\n", line_pos, start.end())
+            line_pos = start.end()
+            code = text[line_pos : stop.start()]
+            try:
+                ast = _parse(code, self.path, "exec", type_comments=True)
+            except SyntaxError:
+                try:
+                    _parse(("\n" * line) + code, self.path, "exec", type_comments=True)
+                except SyntaxError as exc:
+                    raise exc from None
+                raise
+            ast = _Env.transform_code(_incr_lineno(ast, line))
+
+            readers = await _gather(
+                *(
+                    Reader.cached(path=self.path / name, options=self.options)
+                    for name in _unq_eseen(imp[1] for imp in self.IMPORT.finditer(code))
                 )
             )
-
-            async def imports0() -> _AItor[_Itor[_Code]]:
-                for imp in self.IMPORT.finditer(code):
-                    reader = await Reader.cached(
-                        path=self.path / imp[1], options=self.options
-                    )
-                    if not isinstance(reader, CodeLibrary):
-                        raise TypeError(reader)
-                    yield _chain.from_iterable(reader.codes)
-
-            imports = _achain.from_iterable(imports0())
+            imports = tuple(imports0(readers))
             type_ = start[1]
             if type_ == "data":
-                self.__codes[compiler(ast)] = await _atuple(imports)
+                self.__codes.append((compiler(ast), imports))
             elif type_ == "module":
-                self.__library_codes.append(
-                    await _atuple(_achain(imports, (compiler(ast),)))
-                )
+                self.__library_codes.append((*imports, compiler(ast)))
             else:
                 raise ValueError(type_)
-            start = self.START.search(text, stop.end())
+            pos = stop.end()
 
     def pipe(self):
         assert isinstance(self, Reader)
@@ -338,11 +369,13 @@ class MarkdownReader:
                 for final in finals:
                     final()
 
+        library_codes = tuple(_unq_eseen(_chain.from_iterable(self.__library_codes)))
+
         def ret_gen():
-            for code, library in self.__codes.items():
+            for code, library in _unq_eseen(self.__codes):
                 ret = _PyWriter(
                     code,
-                    init_codes=_unq_eseen(_chain(library, *self.codes)),
+                    init_codes=_unq_eseen(_chain(library, library_codes)),
                     env=_Python_env(self, modifier),
                     options=self.options,
                 )
@@ -15,18 +15,28 @@ from ._env import Environment as _Env
 from ._options import GenOpts as _GenOpts
 from abc import ABCMeta as _ABCM, abstractmethod as _amethod
 from anyio import Path as _Path
-from asyncio import create_task, gather as _gather
+from asyncio import gather as _gather
+from collections import defaultdict as _defdict
 from contextlib import (
     AbstractAsyncContextManager as _AACtxMgr,
     asynccontextmanager as _actxmgr,
     nullcontext as _nullctx,
 )
 from datetime import datetime as _datetime
+from itertools import starmap as _starmap
 from re import compile as _re_comp
 from types import CodeType as _Code
 from typing import Any as _Any, ClassVar as _ClsVar, Iterable as _Iter
 
 
+def _equals_except(text: str, other: str, start: int, stop: int):
+    return (
+        len(text) - (stop - start) == len(other)
+        and text.startswith(other[:start])
+        and text.endswith(other[start:], stop)
+    )
+
+
 class Writer(metaclass=_ABCM):
     __slots__: _ClsVar = ()
 
@@ -61,14 +71,10 @@ class ClearWriter:
 
             async def process(io: _ATxtIO):
                 read = await _wrap_a(io.read())
-                seek = create_task(_wrap_a(io.seek(0)))
-                try:
-                    if (text := self.__FLASHCARD_STATES_REGEX.sub("", read)) != read:
-                        await seek
-                        await _wrap_a(io.write(text))
-                        await _wrap_a(io.truncate())
-                finally:
-                    seek.cancel()
+                if (text := self.__FLASHCARD_STATES_REGEX.sub("", read)) != read:
+                    await _wrap_a(io.seek(0))
+                    await _wrap_a(io.write(text))
+                    await _wrap_a(io.truncate())
 
         else:
 
@@ -130,35 +136,39 @@ class PythonWriter:
         try:
             yield
         finally:
+            new_timestamp = (
+                _GEN_CMT_FMT.format(now=_datetime.now().astimezone().isoformat())
+                if self.__options.timestamp
+                else None
+            )
 
             async def process(result: _Ret):
-                loc = result.location
-                path = loc.path
+                async with result.location.open() as io:
+                    read = await _wrap_a(io.read())
+                    timestamp = _GEN_CMT_RE.search(read)
+                    if not (
+                        _equals_except(read, result.text, *timestamp.span())
+                        if timestamp
+                        else read == result.text
+                    ):
+                        text = (
+                            new_timestamp
+                            if new_timestamp is not None
+                            else timestamp[0] if timestamp else ""
+                        ) + result.text
+                        await _wrap_a(io.seek(0))
+                        await _wrap_a(io.write(text))
+                        await _wrap_a(io.truncate())
+
+            async def process_path(path: _Path | None, results: _Iter[_Ret]):
                 async with _nullctx() if path is None else _lck_f(path):
-                    async with loc.open() as io:
-                        read = await _wrap_a(io.read())
-                        seek = create_task(_wrap_a(io.seek(0)))
-                        try:
-                            timestamp = _GEN_CMT_RE.search(read)
-                            if result.text != (
-                                read[: timestamp.start()] + read[timestamp.end() :]
-                                if timestamp
-                                else read
-                            ):
-                                text = (
-                                    _GEN_CMT_FMT.format(
-                                        now=_datetime.now().astimezone().isoformat()
-                                    )
-                                    if self.__options.timestamp
-                                    else timestamp[0] if timestamp else ""
-                                ) + result.text
-                                await seek
-                                await _wrap_a(io.write(text))
-                                await _wrap_a(io.truncate())
-                        finally:
-                            seek.cancel()
-
-            await _gather(*map(process, results))
+                    for result in results:
+                        await process(result)
+
+            groups = _defdict[_Path | None, list[_Ret]](list)
+            for result in results:
+                groups[result.location.path].append(result)
+            await _gather(*_starmap(process_path, groups.items()))
 
 
 assert issubclass(PythonWriter, Writer)
@@ -3,6 +3,7 @@ from .. import NAME as _NAME, OPEN_TEXT_OPTIONS as _OPEN_TXT_OPTS
 from ..util import (
     abc_subclasshook_check as _abc_sch_chk,
     async_lock as _a_lock,
+    keyed_lock as _keyed_lock,
     wrap_async as _wrap_a,
 )
 from abc import ABCMeta as _ABCM, abstractmethod as _amethod
@@ -13,12 +14,9 @@ from contextlib import (
     AbstractAsyncContextManager as _AACtxMgr,
     asynccontextmanager as _actxmgr,
 )
-from dataclasses import dataclass as _dc
-from functools import cache as _cache
+from dataclasses import dataclass as _dc, field as _field
 from io import StringIO as _StrIO
-from itertools import islice as _islice
 from os import stat as _stat
-from os.path import splitext as _splitext
 from re import (
     DOTALL as _DOTALL,
     Match as _Match,
@@ -39,7 +37,6 @@ from typing import (
     TypeGuard as _TGuard,
     final as _fin,
 )
-from weakref import WeakKeyDictionary as _WkKDict
 
 AnyTextIO = _TxtIO | _AFile[str]
 _FILE_LOCKS = _defdict[_Path, _TLock](_TLock)
@@ -144,6 +141,17 @@ class FileSection:
         start: str
         stop: str
         data: _Call[[_Match[str]], str]
+        regex: _Pattern[str] = _field(init=False, repr=False, compare=False)
+
+        def __post_init__(self):
+            object.__setattr__(
+                self,
+                "regex",
+                _re_comp(
+                    rf"(?:{self.start_regex.pattern})|(?P<end>{self.end_regex.pattern})",
+                    self.start_regex.flags | self.end_regex.flags,
+                ),
+            )
 
     SECTION_FORMATS: _ClsVar = {
         "": SectionFormat(
@@ -210,16 +218,15 @@ class _FileSectionCache(dict[_Path, _Await[_FileSectionCacheData]]):
 
     def __init__(self):
         super().__init__()
-        self.__locks = _WkKDict[_Path, _Call[[], _TLock]]()
+        self.__locks = dict[_Path, _TLock]()
 
     async def __getitem__(self, key: _Path):
         key = await key.resolve(strict=True)
-        _, ext = _splitext(key)
         try:
-            format = FileSection.SECTION_FORMATS[ext]
+            format = FileSection.SECTION_FORMATS[key.suffix.lower()]
         except KeyError as ex:
             raise ValueError(f"Unknown extension: {key}") from ex
-        async with _a_lock(self.__locks.setdefault(key, _cache(_TLock))()):
+        async with _a_lock(_keyed_lock(self.__locks, key)):
             try:
                 cache = await super().__getitem__(key)
             except KeyError:
@@ -230,31 +237,28 @@ class _FileSectionCache(dict[_Path, _Await[_FileSectionCacheData]]):
                     async with await key.open(mode="rt", **_OPEN_TXT_OPTS) as file:
                         text = await file.read()
                     sections = dict[str, tuple[slice, str]]()
-                    read_to = 0
-                    for start in format.start_regex.finditer(text):
-                        start_idx = start.start()
-                        if start.start() < read_to:
+                    start: _Match[str] | None = None
+                    for match in format.regex.finditer(text):
+                        if match["end"] is None:
+                            if start is not None:
+                                raise ValueError(
+                                    f"Overlapping section at char {match.start()}: {key}"
+                                )
+                            start = match
+                            continue
+                        if start is None:
                             raise ValueError(
-                                f"Overlapping section at char {start.start()}: {key}"
+                                f"Too many closings at char {match.start()}: {key}"
                             )
                         section = format.data(start)
                         if section in sections:
                             raise ValueError(f'Duplicated section "{section}": {key}')
-                        end_str = format.stop.format(section=section)
-                        try:
-                            end_idx = text.index(end_str, start.end())
-                        except ValueError as ex:
-                            raise ValueError(
-                                f"Unenclosure from char {start.start()}: {key}"
-                            ) from ex
-                        slice0 = slice(start_idx + len(start[0]), end_idx)
+                        slice0 = slice(start.end(), match.start())
                         sections[section] = (slice0, text[slice0])
-                        read_to = end_idx + len(end_str)
-                    for end in _islice(
-                        format.end_regex.finditer(text), len(sections), None
-                    ):
+                        start = None
+                    if start is not None:
                         raise ValueError(
-                            f"Too many closings at char {end.start()}: {key}"
+                            f"Unenclosure from char {start.start()}: {key}"
                         )
                     cache = _FileSectionCacheData(
                         mod_time=mod_time,
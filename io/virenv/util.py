@@ -9,11 +9,13 @@ from abc import ABCMeta as _ABCM, abstractmethod as _amethod
 from dataclasses import KW_ONLY as _KW_ONLY, dataclass as _dc, field as _field
 from datetime import date as _date
 from re import (
+    ASCII as _ASCII,
     NOFLAG as _NOFLAG,
     Pattern as _Pattern,
     compile as _re_comp,
     escape as _re_esc,
 )
+from sys import maxsize as _maxsize
 from typing import (
     Any as _Any,
     Callable as _Call,
@@ -59,14 +61,22 @@ class TwoSidedFlashcard:
     right: str
     _: _KW_ONLY
     reversible: bool
+    _separator_type: _FcSepT = _field(init=False, repr=False, hash=False, compare=False)
 
-    def __str__(self):
-        return _CFG.flashcard_separators[
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "_separator_type",
             _FcSepT(
                 reversible=self.reversible,
                 multiline="\n" in self.left or "\n" in self.right,
-            )
-        ].join((self.left, self.right))
+            ),
+        )
+
+    def __str__(self):
+        return _CFG.flashcard_separators[self._separator_type].join(
+            (self.left, self.right)
+        )
 
     def __len__(self):
         return 2 if self.reversible else 1
@@ -112,9 +122,7 @@ class ClozeFlashcardGroup:
             self.__pattern_cache[self.token] = pattern = _re_comp(
                 rf"{e_token[0]}((?:(?!{e_token[1]}).)+){e_token[1]}", _NOFLAG
             )
-        object.__setattr__(
-            self, "_clozes", tuple(match[1] for match in pattern.finditer(self.context))
-        )
+        object.__setattr__(self, "_clozes", tuple(pattern.findall(self.context)))
 
     def __str__(self):
         return self.context
@@ -143,7 +151,7 @@ assert issubclass(ClozeFlashcardGroup, FlashcardGroup)
 )
 class FlashcardState:
     FORMAT: _ClsVar = "!{date},{interval},{ease}"
-    REGEX: _ClsVar = _re_comp(r"!(\d{4}-\d{2}-\d{2}),(\d+),(\d+)", _NOFLAG)
+    REGEX: _ClsVar = _re_comp(r"!(\d{4}-\d{2}-\d{2}),(\d+),(\d+)", _ASCII)
 
     date: _date
     interval: int
@@ -155,12 +163,14 @@ class FlashcardState:
         )
 
     @classmethod
-    def compile_many(cls, text: str):
-        for match in cls.REGEX.finditer(text):
+    def compile_many(cls, text: str, pos: int = 0, endpos: int = _maxsize):
+        fromisoformat = _date.fromisoformat
+        for match in cls.REGEX.finditer(text, pos, endpos):
+            date, interval, ease = match.groups()
             yield cls(
-                date=_date.fromisoformat(match[1]),
-                interval=int(match[2]),
-                ease=int(match[3]),
+                date=fromisoformat(date),
+                interval=int(interval),
+                ease=int(ease),
             )
 
     @classmethod
@@ -192,7 +202,9 @@ class FlashcardStateGroup(TypedTuple[FlashcardState], element_type=FlashcardStat
     @classmethod
     def compile_many(cls, text: str):
         for match in cls.REGEX.finditer(text):
-            yield cls(FlashcardState.compile_many(text[match.start() : match.end()]))
+            yield cls.from_iterable(
+                FlashcardState.compile_many(text, match.start(), match.end())
+            )
 
     @classmethod
     def compile(cls, text: str):
@@ -1,22 +1,46 @@
 from . import VERSION as _VER
-from .clear.main import (
-    __name__ as _clear_name,
-    __package__ as _clear_package,
-    parser as _clear_parser,
-)
-from .generate.main import (
-    __name__ as _generate_name,
-    __package__ as _generate_package,
-    parser as _generate_parser,
-)
 from argparse import ArgumentParser as _ArgParser
-from functools import partial as _partial
-from typing import Callable as _Call
+from functools import cache as _cache, partial as _partial
+from importlib import import_module as _import
+from typing import (
+    AbstractSet as _ASet,
+    Callable as _Call,
+    Collection as _Collect,
+    Sequence as _Seq,
+)
+
+_PROG = __package__ or __name__
+_SUBCOMMANDS = ("clear", "generate")
+
+
+def sniff_subcommand(args: _Seq[str]):
+    for arg in args:
+        if not arg.startswith("-"):
+            return arg if arg in _SUBCOMMANDS else None
+    return None
 
 
-def parser(parent: _Call[..., _ArgParser] | None = None):
-    prog = __package__ or __name__
+def parser(
+    parent: _Call[..., _ArgParser] | None = None,
+    *,
+    subcommands: _Collect[str] | None = None,
+):
+    subcommands = frozenset(_SUBCOMMANDS if subcommands is None else subcommands)
+    for subcommand in subcommands:
+        if subcommand not in _SUBCOMMANDS:
+            raise ValueError(subcommand)
+    if parent is None:
+        return _default_parser(subcommands)
+    return _parser(parent, subcommands)
 
+
+@_cache
+def _default_parser(subcommands: _ASet[str]):
+    return _parser(None, subcommands)
+
+
+def _parser(parent: _Call[..., _ArgParser] | None, subcommands: _ASet[str]):
+    prog = _PROG
     parser = (_ArgParser if parent is None else parent)(
         prog=f"python -m {prog}",
         description="tools for notes",
@@ -34,16 +58,10 @@ def parser(parent: _Call[..., _ArgParser] | None = None):
     subparsers = parser.add_subparsers(
         required=True,
     )
-    _clear_parser(
-        _partial(
-            subparsers.add_parser,
-            (_clear_package or _clear_name).replace(f"{prog}.", ""),
-        )
-    )
-    _generate_parser(
-        _partial(
-            subparsers.add_parser,
-            (_generate_package or _generate_name).replace(f"{prog}.", ""),
-        )
-    )
+    for name in _SUBCOMMANDS:
+        add_parser = _partial(subparsers.add_parser, name)
+        if name in subcommands:
+            _import(f".{name}.main", __package__).parser(add_parser)
+        else:
+            add_parser()
     return parser
@@ -0,0 +1,36 @@
+from anyio import Path
+from asyncio import run
+from pytest import raises
+from pytextgen.io import GenOpts, MarkdownReader
+from pytextgen.util import CompileCache
+
+
+def test_syntax_error_reports_source_line(tmp_path):
+    text = (
+        "# title\n"
+        "\n"
+        "```Python\n"
+        "# pytextgen generate data\n"
+        "x = 1\n"
+        "```\n"
+        "\n"
+        "```Python\n"
+        "# pytextgen generate data\n"
+        "y = 2\n"
+        "z = (\n"
+        "```\n"
+    )
+    path = Path(tmp_path / "syntax.md")
+    reader = MarkdownReader(
+        path=path,
+        options=GenOpts(
+            timestamp=False,
+            init_flashcards=False,
+            compiler=CompileCache(folder=None).compile,
+        ),
+    )
+    with raises(SyntaxError) as info:
+        run(reader.read(text))
+    assert info.value.lineno == 11
+    assert info.value.text == "z = (\n"
+    assert info.value.offset == 5
@@ -22,6 +22,7 @@ from json import JSONDecodeError as _JSONDecErr, dumps as _dumps, loads as _load
 from marshal import dumps as _m_dumps, loads as _m_loads
 from operator import attrgetter as _attrgetter
 from os import PathLike as _PathL, remove as _rm
+from os.path import realpath as _realpath
 from re import escape as _re_esc
 from regex import VERSION0 as _REX_VER0, compile as _rex_comp
 from sys import maxunicode as _maxunicode, modules as _mods
@@ -38,6 +39,7 @@ from typing import (
     Iterable as _Iter,
     Iterator as _Itor,
     Literal as _Lit,
+    MutableMapping as _MutMap,
     Protocol as _Proto,
     Self as _Self,
     Sequence as _Seq,
@@ -71,9 +73,17 @@ _PUNCTUATION_REGEX = _rex_comp(
     _REX_VER0,
 )
 _ASYNC_LOCK_THREAD_POOLS = _WkKDict[_TLock, _Call[[], _Executor]]()
+_KEYED_LOCKS_LOCK = _TLock()
 _rm_a = sync_to_async(_rm)
 
 
+def _realpaths(paths: _Iter[_PathL[str]], strict: bool):
+    return tuple(_realpath(path, strict=strict) for path in paths)
+
+
+_realpaths_a = sync_to_async(_realpaths)
+
+
 @_overload
 async def wrap_async(value: _Await[_T]) -> _T: ...
 
@@ -88,6 +98,10 @@ async def wrap_async(value: _Await[_T] | _T):
     return value
 
 
+async def resolve_paths(paths: _Iter[_PathL[str]], /, *, strict: bool = False):
+    return tuple(map(_Path, await _realpaths_a(tuple(paths), strict)))
+
+
 def identity(var: _T) -> _T:
     return var
 
@@ -123,6 +137,15 @@ async def async_lock(lock: _TLock):
         lock.release()
 
 
+def keyed_lock(locks: _MutMap[_T, _TLock], key: _T, /):
+    with _KEYED_LOCKS_LOCK:
+        try:
+            return locks[key]
+        except KeyError:
+            ret = locks[key] = _TLock()
+            return ret
+
+
 def deep_foreach_module(module: _Mod):
     names = set[str]()
 
@@ -238,6 +261,10 @@ class TypedTuple(_Genic[_T], tuple[_T, ...]):
             return super().__new__(cls, _cast(_Iter[_T], items[0]))
         return super().__new__(cls, _cast(_Iter[_T], items))
 
+    @classmethod
+    def from_iterable(cls, iterable: _Iter[_T], /) -> _Self:
+        return tuple.__new__(cls, iterable)
+
     def __repr__(self):
         return type(self).__qualname__ + super().__repr__()
 